@@ -8,50 +8,45 @@ from utils.helper import (
 def insert_caddy_params(rainb0w_config: dict, caddy_config_file: str):
     print("Configuring Caddy...")
     caddy_config = load_json(caddy_config_file)
+    main_domain = rainb0w_config["DOMAINS"]["MAIN_DOMAIN"]
+    cdn_domain = rainb0w_config["DOMAINS"]["CDN_COMPAT_DOMAIN"]
+    proxies_by_type = {item["type"]: item for item in rainb0w_config["PROXY"]}
+    http_servers = caddy_config["apps"]["http"]["servers"]
+    tls_app = caddy_config["apps"]["tls"]
 
     # Configure TLS reverse proxy
     caddy_config["apps"]["layer4"]["servers"]["tls_proxy"]["routes"][0]["match"][0][
         "tls"
-    ]["sni"] = [rainb0w_config["DOMAINS"]["CDN_COMPAT_DOMAIN"]]
+    ]["sni"] = [cdn_domain]
 
     # Configure HTTPS web server and reverse proxy
-    caddy_config["apps"]["http"]["servers"]["web-secure"]["routes"][0]["match"][0][
-        "host"
-    ] = [rainb0w_config["DOMAINS"]["MAIN_DOMAIN"]]
-    caddy_config["apps"]["http"]["servers"]["fallback"]["routes"][0]["match"][0][
-        "host"
-    ] = [rainb0w_config["DOMAINS"]["CDN_COMPAT_DOMAIN"]]
+    http_servers["web-secure"]["routes"][0]["match"][0]["host"] = [main_domain]
+    http_servers["fallback"]["routes"][0]["match"][0]["host"] = [cdn_domain]
 
     # Add domains and SNIs for TLS automation
-    if is_domain(rainb0w_config["DOMAINS"]["MAIN_DOMAIN"]):
-        caddy_config["apps"]["http"]["servers"]["web-secure"][
-            "tls_connection_policies"
-        ][0]["match"]["sni"] = [
-            rainb0w_config["DOMAINS"]["MAIN_DOMAIN"],
-            f"*.{rainb0w_config['DOMAINS']['MAIN_DOMAIN']}",
+    if is_domain(main_domain):
+        http_servers["web-secure"]["tls_connection_policies"][0]["match"]["sni"] = [
+            main_domain,
+            f"*.{main_domain}",
         ]
-        caddy_config["apps"]["tls"]["certificates"]["automate"] = [
-            rainb0w_config["DOMAINS"]["MAIN_DOMAIN"],
-            f"*.{rainb0w_config['DOMAINS']['MAIN_DOMAIN']}",
+        tls_app["certificates"]["automate"] = [
+            main_domain,
+            f"*.{main_domain}",
         ]
-        caddy_config["apps"]["tls"]["automation"]["policies"][0]["subjects"] = [
-            rainb0w_config["DOMAINS"]["MAIN_DOMAIN"],
-            f"*.{rainb0w_config['DOMAINS']['MAIN_DOMAIN']}",
+        tls_app["automation"]["policies"][0]["subjects"] = [
+            main_domain,
+            f"*.{main_domain}",
         ]
-    elif is_subdomain(rainb0w_config["DOMAINS"]["MAIN_DOMAIN"]):
-        main_domain = extract_domain(rainb0w_config["DOMAINS"]["MAIN_DOMAIN"])
-        caddy_config["apps"]["http"]["servers"]["web-secure"][
-            "tls_connection_policies"
-        ][0]["match"]["sni"] = [f"*.{main_domain}"]
-        caddy_config["apps"]["tls"]["certificates"]["automate"] = [
-            f"*.{main_domain}"
-        ]
-        caddy_config["apps"]["tls"]["automation"]["policies"][0]["subjects"] = [
-            f"*.{main_domain}"
+    elif is_subdomain(main_domain):
+        root_domain = extract_domain(main_domain)
+        http_servers["web-secure"]["tls_connection_policies"][0]["match"]["sni"] = [
+            f"*.{root_domain}"
         ]
+        tls_app["certificates"]["automate"] = [f"*.{root_domain}"]
+        tls_app["automation"]["policies"][0]["subjects"] = [f"*.{root_domain}"]
 
     # Add Cloudflare API key
-    caddy_config["apps"]["tls"]["automation"]["policies"][0]["issuers"] = [
+    tls_app["automation"]["policies"][0]["issuers"] = [
             {
                 "challenges": {
                     "dns": {
@@ -65,28 +60,18 @@ def insert_caddy_params(rainb0w_config: dict, caddy_config_file: str):
             }
         ]
 
+    fallback_routes = http_servers["fallback"]["routes"][0]["handle"][0]["routes"]
+
     # VLESS WS
-    proxy_config = next(
-        (item for item in rainb0w_config["PROXY"] if item["type"] == "VLESS_WS")
-    )
-    caddy_config["apps"]["http"]["servers"]["fallback"]["routes"][0]["handle"][0][
-        "routes"
-    ][0]["match"][0]["path"] = [proxy_config["path"]]
+    proxy_config = proxies_by_type["VLESS_WS"]
+    fallback_routes[0]["match"][0]["path"] = [proxy_config["path"]]
 
     # VLESS HTTPUpgrade
-    proxy_config = next(
-        (item for item in rainb0w_config["PROXY"] if item["type"] == "VLESS_HTTPUPGRADE")
-    )
-    caddy_config["apps"]["http"]["servers"]["fallback"]["routes"][0]["handle"][0][
-        "routes"
-    ][1]["match"][0]["path"] = [proxy_config["path"]]
+    proxy_config = proxies_by_type["VLESS_HTTPUPGRADE"]
+    fallback_routes[1]["match"][0]["path"] = [proxy_config["path"]]
 
     # VLESS gRPC
-    proxy_config = next(
-        (item for item in rainb0w_config["PROXY"] if item["type"] == "VLESS_GRPC")
-    )
-    caddy_config["apps"]["http"]["servers"]["fallback"]["routes"][0]["handle"][0][
-        "routes"
-    ][2]["match"][0]["path"] = [f"/{proxy_config['service_name']}/*"]
+    proxy_config = proxies_by_type["VLESS_GRPC"]
+    fallback_routes[2]["match"][0]["path"] = [f"/{proxy_config['service_name']}/*"]
 
     save_json(caddy_config, caddy_config_file)
@@ -66,29 +66,22 @@ def gen_hysteria_proxy_params(main_domain: str) -> dict:
 def insert_proxy_params(proxy_params: list, config_file_path: str):
     print("Configuring Sing-Box...")
     config = load_json(config_file_path)
+    proxies_by_type = {item["type"]: item for item in proxy_params}
 
     for inbound in config["inbounds"]:
         if inbound["tag"] == "VLESS_WS":
-            proxy_config = next(
-                (item for item in proxy_params if item["type"] == "VLESS_WS")
-            )
+            proxy_config = proxies_by_type["VLESS_WS"]
             inbound["transport"]["path"] = proxy_config["path"]
             inbound["transport"]["headers"]["Host"] = proxy_config["host"]
         elif inbound["tag"] == "VLESS_HTTPUPGRADE":
-            proxy_config = next(
-                (item for item in proxy_params if item["type"] == "VLESS_HTTPUPGRADE")
-            )
+            proxy_config = proxies_by_type["VLESS_HTTPUPGRADE"]
             inbound["transport"]["path"] = proxy_config["path"]
             inbound["transport"]["host"] = proxy_config["host"]
         elif inbound["tag"] == "VLESS_GRPC":
-            proxy_config = next(
-                (item for item in proxy_params if item["type"] == "VLESS_GRPC")
-            )
+            proxy_config = proxies_by_type["VLESS_GRPC"]
             inbound["transport"]["service_name"] = proxy_config["service_name"]
         elif inbound["tag"] == "HYSTERIA":
-            proxy_config = next(
-                (item for item in proxy_params if item["type"] == "HYSTERIA")
-            )
+            proxy_config = proxies_by_type["HYSTERIA"]
             inbound["obfs"]["password"] = proxy_config["obfs"]
             inbound["masquerade"] = proxy_config["masquerade"]
         else:
@@ -50,29 +50,28 @@ def add_share_urls(
     rainb0w_config_file: str,
 ) -> dict:
     rainb0w_config = load_toml(rainb0w_config_file)
-    domains = rainb0w_config["DOMAINS"]
-    proxies = rainb0w_config["PROXY"]
+    cdn_domain = rainb0w_config["DOMAINS"]["CDN_COMPAT_DOMAIN"]
+    direct_domain = rainb0w_config["DOMAINS"]["DIRECT_CONN_DOMAIN"]
+    proxies_by_type = {item["type"]: item for item in rainb0w_config["PROXY"]}
 
-    proxy_config = next((item for item in proxies if item["type"] == "VLESS_WS"))
+    proxy_config = proxies_by_type["VLESS_WS"]
     user_info["vless_ws_url"] = (
-        f"vless://{user_info['uuid']}@{domains['CDN_COMPAT_DOMAIN']}:443?path={proxy_config['path']}&security=tls&encryption=none&alpn=http/1.1&host={proxy_config['host']}&type=ws&fp=randomized&sni={domains['CDN_COMPAT_DOMAIN']}#VLESS%20Websocket"
+        f"vless://{user_info['uuid']}@{cdn_domain}:443?path={proxy_config['path']}&security=tls&encryption=none&alpn=http/1.1&host={proxy_config['host']}&type=ws&fp=randomized&sni={cdn_domain}#VLESS%20Websocket"
     )
 
-    proxy_config = next(
-        (item for item in proxies if item["type"] == "VLESS_HTTPUPGRADE")
-    )
+    proxy_config = proxies_by_type["VLESS_HTTPUPGRADE"]
     user_info["vless_httpupgrade_url"] = (
-        f"vless://{user_info['uuid']}@{domains['CDN_COMPAT_DOMAIN']}:443?security=tls&encryption=none&alpn=http/1.1&host={proxy_config['host']}&path={proxy_config['path']}&type=httupgrade&fp=randomized&sni={domains['CDN_COMPAT_DOMAIN']}#VLESS%20HTTUpgrade"
+        f"vless://{user_info['uuid']}@{cdn_domain}:443?security=tls&encryption=none&alpn=http/1.1&host={proxy_config['host']}&path={proxy_config['path']}&type=httupgrade&fp=randomized&sni={cdn_domain}#VLESS%20HTTUpgrade"
     )
 
-    proxy_config = next((item for item in proxies if item["type"] == "VLESS_GRPC"))
+    proxy_config = proxies_by_type["VLESS_GRPC"]
     user_info["vless_grpc_url"] = (
-        f"vless://{user_info['uuid']}@{domains['CDN_COMPAT_DOMAIN']}:443?mode=gun&security=tls&encryption=none&alpn=h2,http/1.1&type=grpc&serviceName={proxy_config['service_name']}&fp=randomized&sni={domains['CDN_COMPAT_DOMAIN']}#VLESS%20gRPC"
+        f"vless://{user_info['uuid']}@{cdn_domain}:443?mode=gun&security=tls&encryption=none&alpn=h2,http/1.1&type=grpc&serviceName={proxy_config['service_name']}&fp=randomized&sni={cdn_domain}#VLESS%20gRPC"
     )
 
-    proxy_config = next((item for item in proxies if item["type"] == "HYSTERIA"))
+    proxy_config = proxies_by_type["HYSTERIA"]
     user_info["hysteria_url"] = (
-        f"hysteria2://{user_info['password']}@{domains['DIRECT_CONN_DOMAIN']}:8443/?obfs=salamander&obfs-password={proxy_config['obfs']}&sni={domains['DIRECT_CONN_DOMAIN']}#Hysteria"
+        f"hysteria2://{user_info['password']}@{direct_domain}:8443/?obfs=salamander&obfs-password={proxy_config['obfs']}&sni={direct_domain}#Hysteria"
     )
 
     return user_info
@@ -112,14 +111,13 @@ def remove_user(
     rainb0w_users = get_users(rainb0w_users_file)
     singbox_config = load_json(singbox_config_file)
     if rainb0w_users:
-        for user in rainb0w_users:
-            if user["name"] == username:
-                print(f"Removing the user '{username}'...")
-                for inbound in singbox_config["inbounds"]:
-                    if "users" in inbound:
-                        for user in inbound["users"]:
-                            if user["name"] == username:
-                                inbound["users"].remove(user)
+        if any(user["name"] == username for user in rainb0w_users):
+            print(f"Removing the user '{username}'...")
+            for inbound in singbox_config["inbounds"]:
+                if "users" in inbound:
+                    inbound["users"] = [
+                        user for user in inbound["users"] if user["name"] != username
+                    ]
 
         rainb0w_users = [user for user in rainb0w_users if user["name"] != username]
 
@@ -1,23 +1,24 @@
 import re
 
+DOMAIN_REGEX = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9\-]{1,61}[a-zA-Z0-9]\.[a-zA-Z]{2,}$")
+SUBDOMAIN_REGEX = re.compile(r"(.*)\.(.*)\.(.*)")
+# Regex for domain names ending in .gq, .cf, .ml, .tk, or .ga
+FREE_DOMAIN_REGEX = re.compile(r"[\w-]+\.(gq|cf|ml|tk|ga)$")
+
 
 def is_domain(domain: str) -> bool:
-    regex = r"^[a-zA-Z0-9][a-zA-Z0-9\-]{1,61}[a-zA-Z0-9]\.[a-zA-Z]{2,}$"
-    if re.search(regex, domain):
+    if DOMAIN_REGEX.search(domain):
         return True
     else:
         return False
 
 
 def is_subdomain(input: str) -> bool:
-    pattern = r"(.*)\.(.*)\.(.*)"
-    return True if re.match(pattern, input) else False
+    return True if SUBDOMAIN_REGEX.match(input) else False
 
 
 def is_free_domain(domain: str) -> bool:
-    # Regex for domain names ending in .gq, .cf, .ml, .tk, or .ga
-    regex = r"[\w-]+\.(gq|cf|ml|tk|ga)$"
-    return True if re.search(regex, domain) else False
+    return True if FREE_DOMAIN_REGEX.search(domain) else False
 
 
 def extract_domain(domain: str) -> str:
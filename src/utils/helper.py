@@ -107,10 +107,7 @@ def bytes_to_raw_str(bytes_obj: bytes):
     Byte objects are wrapped in b'' when printed in Python, this func
     strips them and returns a raw str representation
     """
-    string = ""
-    for byte in bytes_obj:
-        string += chr(byte)
-    return string
+    return "".join(map(chr, bytes_obj))
 
 
 def bytes_to_url_safe_base64(data):
@@ -118,12 +115,8 @@ def bytes_to_url_safe_base64(data):
 
 
 def bytes_to_hex(byte_arr):
-    hex_list = []
-    for byte in byte_arr:
-        current = byte if byte >= 0 else byte + 256
-        hex_list.append(format(current >> 4, "x"))
-        hex_list.append(format(current & 0xF, "x"))
-    return "".join(hex_list)
+    # Masking maps signed bytes (-128..-1) onto 128..255
+    return bytes(byte & 0xFF for byte in byte_arr).hex()
 
 
 def get_mem_size():